@@ -9,16 +9,46 @@
 
 import os
 import re
+import sys
+import atexit
 import json
 import time
 import platform
 import webbrowser
 import threading
+import queue
+from collections import namedtuple
+from functools import lru_cache
+from operator import itemgetter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
 from urllib.parse import quote
 from datetime import datetime, timezone
-from typing import Dict, List, Tuple, Optional, Set
+from typing import Callable, Dict, List, Tuple, Optional, Set
+
+# orjson is optional; it parses/serializes several times faster than stdlib json
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+
+    def _dumps_line(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+    def _dumps_line(obj) -> str:
+        return json.dumps(obj)
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import customtkinter as ctk
 import tkinter.messagebox as messagebox
 import tkinter.filedialog as filedialog
@@ -28,6 +58,12 @@ import tkinter.filedialog as filedialog
 # ----------------------------
 OPENLIKE_STATUSES = ["OPEN", "INVESTIGATING", "WAITING"]
 PAGE_SIZE = 100
+COMMENTS_CACHE_TTL = 60  # seconds a fetched comment list is reused
+PREFETCH_MARGIN = 20  # rows above/below the viewport whose comments are prefetched
+ROW_RENDER_BATCH = 40  # investigation cards materialized per scroll step
+REBUILD_DEBOUNCE_MS = 50  # quiet period before a requested list rebuild runs
+COMMENTS_DISPLAY_PAGE = 100  # comments written to the comments box per page
+LOG_DRAIN_MS = 100  # how long worker log lines are batched before one status-box write
 START_DATE = "2024-01-01"
 END_DATE = None
 
@@ -35,10 +71,48 @@ END_DATE = None
 BASE_V2 = ""
 BASE_V1 = ""
 URL_V1_CREATE_COMMENT = ""
+URL_V1_COMMENTS = ""
+# Per-investigation v2 URL templates, built once per region in set_api_endpoints
+BASE_V2_ITEM_TMPL = ""
+BASE_V2_STATUS_TMPL = ""
+BASE_V2_DISPO_TMPL = ""
+BASE_V2_ASSIGNEE_TMPL = ""
 
 # These headers are filled after API key resolution
-V2_HEADERS = {}
 V1_HEADERS = {}
+# Headers v2 sends on top of the session defaults (V1_HEADERS)
+V2_EXTRA_HEADERS = {"Accept-version": "investigations-preview"}
+
+# Shared worker pool for API round-trips; the worker cap bounds how many
+# requests are in flight against the IDR rate limiter at any one time.
+MAX_WORKERS = 12
+UPDATE_CONCURRENCY = 8  # investigations a bulk update works on at once
+EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+# Shared HTTP session: keep-alive connections are reused across calls and
+# across EXECUTOR threads. The per-host pool holds one socket per pool worker
+# plus a few for the UI/refresh threads that call the API directly, so no
+# thread ever opens (and then discards) an overflow connection. POST is left
+# out of the retried methods so a transient 5xx can never double-post a comment.
+HTTP_POOL_MAXSIZE = MAX_WORKERS + 4
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,  # distinct hosts kept warm (one API host per region)
+    pool_maxsize=HTTP_POOL_MAXSIZE,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "PUT", "PATCH"],
+        raise_on_status=False,
+    ),
+))
+
+# "patch" or "put": the assignee method this tenant accepted (None = not yet known)
+_ASSIGN_METHOD: Optional[str] = None
+
+# id -> rrn for every investigation seen by list_investigations
+_ID_TO_RRN: Dict[str, str] = {}
 
 IDR_INVESTIGATION_TAIL_RE = re.compile(r":investigation:([^:]+)\s*$")
 
@@ -47,7 +121,12 @@ IDR_INVESTIGATION_TAIL_RE = re.compile(r":investigation:([^:]+)\s*$")
 # ----------------------------
 APP_DIR_NAME = "InsightIDRUpdater"
 SETTINGS_FILENAME = "config.json"
+SETTINGS_SAFETY_FLUSH_MS = 30000  # periodic write-back of dirty settings
+HISTORY_FILENAME = "comment_history.jsonl"
+HISTORY_KEEP = 50  # comment history entries kept
 
+# Both paths are fixed for the life of the process, so resolve them once
+@lru_cache(maxsize=None)
 def _app_support_dir() -> str:
     system = platform.system()
     if system == "Windows":
@@ -60,29 +139,126 @@ def _app_support_dir() -> str:
         base = os.path.join(os.path.expanduser("~"), ".config")
         return os.path.join(base, APP_DIR_NAME)
 
+@lru_cache(maxsize=None)
 def _settings_path() -> str:
     d = _app_support_dir()
     os.makedirs(d, exist_ok=True)
     return os.path.join(d, SETTINGS_FILENAME)
 
-def load_settings() -> Dict:
+# Settings live in memory for the whole session; writes only mark the cache
+# dirty. _flush_settings persists it on exit, on window close, and on the
+# App's periodic safety flush.
+_SETTINGS_CACHE: Optional[Dict] = None
+_SETTINGS_DIRTY = False
+_SETTINGS_LOCK = threading.Lock()
+
+def _read_settings_file() -> Dict:
     p = _settings_path()
     if os.path.exists(p):
         try:
             with open(p, "r", encoding="utf-8") as f:
-                return json.load(f)
+                return _loads(f.read())
         except Exception:
             return {}
     return {}
 
+def load_settings() -> Dict:
+    global _SETTINGS_CACHE
+    with _SETTINGS_LOCK:
+        if _SETTINGS_CACHE is None:
+            _SETTINGS_CACHE = _read_settings_file()
+        return _SETTINGS_CACHE
+
 def save_settings(cfg: Dict):
-    p = _settings_path()
+    global _SETTINGS_CACHE, _SETTINGS_DIRTY
+    with _SETTINGS_LOCK:
+        _SETTINGS_CACHE = cfg
+        _SETTINGS_DIRTY = True
+
+def _flush_settings():
+    """Write the cached settings to disk if they changed (atomic replace)."""
+    global _SETTINGS_DIRTY
+    with _SETTINGS_LOCK:
+        if not _SETTINGS_DIRTY or _SETTINGS_CACHE is None:
+            return
+        p = _settings_path()
+        tmp = p + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(_dumps(_SETTINGS_CACHE))
+            os.replace(tmp, p)
+            _SETTINGS_DIRTY = False
+        except Exception:
+            pass
+
+atexit.register(_flush_settings)
+
+# ----------------------------
+# Comment history (append-only JSONL next to config.json)
+# ----------------------------
+def _history_path() -> str:
+    return os.path.join(os.path.dirname(_settings_path()), HISTORY_FILENAME)
+
+def write_comment_history(entries: List[Dict]):
+    """Rewrite the whole history file (atomic replace)."""
+    p = _history_path()
+    tmp = p + ".tmp"
     try:
-        with open(p, "w", encoding="utf-8") as f:
-            json.dump(cfg, f, indent=2)
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.writelines(_dumps_line(e) + "\n" for e in entries)
+        os.replace(tmp, p)
     except Exception:
         pass
 
+def append_comment_history(entry: Dict):
+    """Append one entry; O(entry) instead of rewriting the file."""
+    try:
+        with open(_history_path(), "a", encoding="utf-8") as f:
+            f.write(_dumps_line(entry) + "\n")
+    except Exception:
+        pass
+
+def load_comment_history() -> List[Dict]:
+    """
+    Return the last HISTORY_KEEP entries, oldest first, one per distinct text.
+    Migrates a legacy cfg["comment_history"] list out of config.json once,
+    and compacts the file when it has grown past HISTORY_KEEP lines or holds
+    superseded duplicates (a re-sent text is appended again, see
+    App._add_to_comment_history).
+    """
+    entries: List[Dict] = []
+    p = _history_path()
+    if os.path.exists(p):
+        try:
+            with open(p, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except Exception:
+            lines = []
+        for line in lines:
+            try:
+                entries.append(_loads(line))
+            except ValueError:
+                continue  # torn/partial line
+
+    cfg = load_settings()
+    legacy = cfg.pop("comment_history", None)
+    if legacy is not None:
+        entries = list(legacy) + entries
+        save_settings(cfg)
+
+    # Keep only the most recent use of each text (LRU order, oldest first)
+    latest: Dict[str, Dict] = {}
+    for e in entries:
+        text = e.get("text", "") if isinstance(e, dict) else ""
+        latest.pop(text, None)
+        latest[text] = e
+    deduped = list(latest.values())
+
+    if legacy is not None or len(deduped) != len(entries) or len(deduped) > HISTORY_KEEP:
+        entries = deduped[-HISTORY_KEEP:]
+        write_comment_history(entries)
+    return entries
+
 def resolve_api_key_from_settings(cfg: Dict) -> Optional[str]:
     """
     Settings schema:
@@ -153,10 +329,18 @@ def save_region_org_to_settings(cfg: Dict, region: str, org_id: str):
 
 def set_api_endpoints(region: str):
     """Set global API endpoints based on region."""
-    global BASE_V2, BASE_V1, URL_V1_CREATE_COMMENT
+    global BASE_V2, BASE_V1, URL_V1_CREATE_COMMENT, URL_V1_COMMENTS
+    global BASE_V2_ITEM_TMPL, BASE_V2_STATUS_TMPL, BASE_V2_DISPO_TMPL, BASE_V2_ASSIGNEE_TMPL
+    global _ASSIGN_METHOD
     BASE_V2 = f"https://{region}.api.insight.rapid7.com/idr/v2/investigations"
     BASE_V1 = f"https://{region}.api.insight.rapid7.com/idr/v1"
     URL_V1_CREATE_COMMENT = f"{BASE_V1}/comments"
+    URL_V1_COMMENTS = URL_V1_CREATE_COMMENT
+    BASE_V2_ITEM_TMPL = BASE_V2 + "/{id}"
+    BASE_V2_STATUS_TMPL = BASE_V2 + "/{id}/status/{s}"
+    BASE_V2_DISPO_TMPL = BASE_V2 + "/{id}/disposition/{d}"
+    BASE_V2_ASSIGNEE_TMPL = BASE_V2 + "/{id}/assignee/{e}"
+    _ASSIGN_METHOD = None  # rediscover against the new endpoint
 
 def console_link(rrn: str, region: str, org_id: str) -> str:
     """Generate console link for an investigation."""
@@ -164,103 +348,152 @@ def console_link(rrn: str, region: str, org_id: str) -> str:
         return ""
     return f"https://{region}.idr.insight.rapid7.com/op/{org_id}#/investigations/{rrn}"
 
+@lru_cache(maxsize=2048)
+def _cached_console_link(rrn: str, region: str, org_id: str) -> str:
+    """console_link memoized for card (re)fills; the key includes region/org, so switching stays correct."""
+    return console_link(rrn, region, org_id)
+
 # ----------------------------
 # Helpers
 # ----------------------------
+@lru_cache(maxsize=4096)
+def _q(segment: str) -> str:
+    """URL-encode one path segment; memoized since the same ids recur across updates."""
+    return quote(segment, safe='')
+
 def iso_boundary(date_str: str, end_of_day: bool = False) -> str:
     if not date_str:
         return ""
     t = "23:59:59Z" if end_of_day else "00:00:00Z"
     return f"{date_str}T{t}"
 
-def parse_iso_to_local(dt: Optional[str]) -> str:
-    """Render API time to local 'YYYY/MM/DD HH:MM'."""
-    if not dt:
-        return ""
-    try:
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+if sys.version_info >= (3, 11):
+    _fromiso = datetime.fromisoformat  # accepts a trailing "Z" natively
+else:
+    def _fromiso(dt: str) -> datetime:
         if dt.endswith("Z"):
-            dt_obj = datetime.fromisoformat(dt.replace("Z", "+00:00"))
-        else:
-            dt_obj = datetime.fromisoformat(dt)
+            dt = dt[:-1] + "+00:00"
+        return datetime.fromisoformat(dt)
+
+@lru_cache(maxsize=8192)
+def _parse_iso_cached(dt: str) -> str:
+    try:
+        dt_obj = _fromiso(dt)
         local = dt_obj.astimezone()  # system tz
         return local.strftime("%Y/%m/%d %H:%M")
     except Exception:
         return dt
 
+def parse_iso_to_local(dt: Optional[str]) -> str:
+    """Render API time to local 'YYYY/MM/DD HH:MM'."""
+    if not dt:
+        return ""
+    return _parse_iso_cached(dt)
+
+def add_local_times(items: List[Dict]) -> List[Dict]:
+    """Store each item's rendered created_time as '_created_local' (run off the UI thread)."""
+    for it in items:
+        it["_created_local"] = parse_iso_to_local(it.get("created_time", ""))
+    return items
+
+@lru_cache(maxsize=4096)
+def _parse_created(dt: str) -> datetime:
+    """Parse an API timestamp for sorting; unparseable values sort as the epoch."""
+    try:
+        return _fromiso(dt)
+    except Exception:  # malformed or non-string values alike
+        return _EPOCH
+
 def now_str() -> str:
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 # ----------------------------
 # API calls
 # ----------------------------
-def list_investigations() -> List[Dict]:
-    """GET v2 investigations with open-like statuses (oldest->newest; UI will sort)."""
-    index = 0
-    all_items: List[Dict] = []
-    statuses_str = ",".join(OPENLIKE_STATUSES)
-    params_base = {
+def _list_params() -> Dict:
+    params = {
         "size": PAGE_SIZE,
-        "statuses": statuses_str,
+        "statuses": ",".join(OPENLIKE_STATUSES),
         "sort": "created_time,ASC",
         "start_time": iso_boundary(START_DATE, end_of_day=False),
     }
     if END_DATE:
-        params_base["end_time"] = iso_boundary(END_DATE, end_of_day=True)
-
-    while True:
-        params = dict(params_base)
-        params["index"] = index
-        r = requests.get(BASE_V2, headers=V2_HEADERS, params=params, timeout=60)
-        r.raise_for_status()
-        payload = r.json() or {}
-        items = payload.get("data", []) or []
-        meta = payload.get("metadata", {}) or {}
-
-        if not items:
-            break
+        params["end_time"] = iso_boundary(END_DATE, end_of_day=True)
+    return params
+
+def _fetch_page(index: int) -> Dict:
+    """GET one page of v2 investigations; returns the raw payload."""
+    params = _list_params()
+    params["index"] = index
+    r = SESSION.get(BASE_V2, headers=V2_EXTRA_HEADERS, params=params, timeout=60)
+    r.raise_for_status()
+    return _loads(r.content) or {}
 
-        all_items.extend(items)
-        total_pages = int(meta.get("total_pages", 0) or 0)
-        current_index = int(meta.get("index", index))
-        if total_pages == 0 or current_index >= (total_pages - 1):
-            break
+def list_investigations(on_progress: Optional[Callable[[int, int], None]] = None) -> List[Dict]:
+    """
+    GET v2 investigations with open-like statuses (oldest->newest; UI will sort).
+    on_progress(pages_done, total_pages) is called from the calling thread.
+    """
+    # Page 0 tells us how many pages there are; the rest are fetched concurrently
+    payload = _fetch_page(0)
+    items = payload.get("data", []) or []
+    meta = payload.get("metadata", {}) or {}
+    if not items:
+        return []
 
-        index += 1
-        time.sleep(0.04)
+    total_pages = int(meta.get("total_pages", 0) or 0)
+    pages: List[List[Dict]] = [items] + [[] for _ in range(max(total_pages - 1, 0))]
+    if on_progress:
+        on_progress(1, max(total_pages, 1))
+    futures = {EXECUTOR.submit(_fetch_page, i): i for i in range(1, total_pages)}
+    for done, fut in enumerate(as_completed(futures), start=2):
+        pages[futures[fut]] = fut.result().get("data", []) or []
+        if on_progress:
+            on_progress(done, total_pages)
 
+    all_items: List[Dict] = []
+    for page in pages:
+        all_items.extend(page)
+    _ID_TO_RRN.update(
+        (item["id"], item["rrn"]) for item in all_items if item.get("id") and item.get("rrn")
+    )
     return all_items
 
 def set_status(id_or_rrn: str, new_status: str):
-    url = f"{BASE_V2}/{quote(id_or_rrn, safe='')}/status/{quote(new_status, safe='')}"
-    r = requests.put(url, headers=V2_HEADERS, timeout=60)
+    url = BASE_V2_STATUS_TMPL.format(id=_q(id_or_rrn), s=_q(new_status))
+    r = SESSION.put(url, headers=V2_EXTRA_HEADERS, timeout=60)
     r.raise_for_status()
 
 def set_disposition(id_or_rrn: str, disposition: str):
-    url = f"{BASE_V2}/{quote(id_or_rrn, safe='')}/disposition/{quote(disposition, safe='')}"
-    r = requests.put(url, headers=V2_HEADERS, timeout=60)
+    url = BASE_V2_DISPO_TMPL.format(id=_q(id_or_rrn), d=_q(disposition))
+    r = SESSION.put(url, headers=V2_EXTRA_HEADERS, timeout=60)
     r.raise_for_status()
 
 def assign_user(id_or_rrn: str, assignee_email: str):
-    url_patch = f"{BASE_V2}/{quote(id_or_rrn, safe='')}"
-    body = {"assignee": {"email": assignee_email}}
-    r = requests.patch(url_patch, headers=V2_HEADERS, json=body, timeout=60)
-    if r.status_code in (200, 204):
-        return
-    url_put = f"{BASE_V2}/{quote(id_or_rrn, safe='')}/assignee/{quote(assignee_email, safe='')}"
-    r2 = requests.put(url_put, headers=V2_HEADERS, timeout=60)
+    global _ASSIGN_METHOD
+    # Once PUT is known to be the working method, skip the doomed PATCH
+    if _ASSIGN_METHOD != "put":
+        url_patch = BASE_V2_ITEM_TMPL.format(id=_q(id_or_rrn))
+        body = {"assignee": {"email": assignee_email}}
+        r = SESSION.patch(url_patch, headers=V2_EXTRA_HEADERS, json=body, timeout=60)
+        if r.status_code in (200, 204):
+            _ASSIGN_METHOD = "patch"
+            return
+    url_put = BASE_V2_ASSIGNEE_TMPL.format(id=_q(id_or_rrn), e=_q(assignee_email))
+    r2 = SESSION.put(url_put, headers=V2_EXTRA_HEADERS, timeout=60)
     r2.raise_for_status()
-
-def get_rrn(id_or_rrn: str) -> str:
-    """Return an investigation RRN. If given an ID, fetch v2 record and return its rrn."""
-    if not id_or_rrn:
-        raise ValueError("Missing investigation id/rrn")
-    if id_or_rrn.startswith("rrn:"):
-        return id_or_rrn
-    # v2 GET by ID (endpoint accepts id or rrn)
-    url = f"{BASE_V2}/{quote(id_or_rrn, safe='')}"
-    r = requests.get(url, headers=V2_HEADERS, timeout=60)
+    if _ASSIGN_METHOD is None:
+        _ASSIGN_METHOD = "put"
+
+@lru_cache(maxsize=1024)
+def _fetch_rrn(inv_id: str) -> str:
+    """v2 GET by ID (endpoint accepts id or rrn); failures are not cached."""
+    url = BASE_V2_ITEM_TMPL.format(id=_q(inv_id))
+    r = SESSION.get(url, headers=V2_EXTRA_HEADERS, timeout=60)
     r.raise_for_status()
-    j = r.json() or {}
+    j = _loads(r.content) or {}
     inv = j.get("data") if isinstance(j, dict) and "data" in j else j
     if not isinstance(inv, dict):
         raise RuntimeError("Unexpected v2 GET response shape")
@@ -269,6 +502,17 @@ def get_rrn(id_or_rrn: str) -> str:
         raise RuntimeError("Could not find RRN in v2 response")
     return rrn
 
+def get_rrn(id_or_rrn: str) -> str:
+    """Return an investigation RRN. If given an ID, fetch v2 record and return its rrn."""
+    if not id_or_rrn:
+        raise ValueError("Missing investigation id/rrn")
+    if id_or_rrn.startswith("rrn:"):
+        return id_or_rrn
+    known = _ID_TO_RRN.get(id_or_rrn)
+    if known:
+        return known
+    return _fetch_rrn(id_or_rrn)
+
 def create_comment_v1(target_rrn: str, text: str) -> dict:
     """
     POST /idr/v1/comments
@@ -278,7 +522,7 @@ def create_comment_v1(target_rrn: str, text: str) -> dict:
     if not text:
         return {"ok": True, "status": 204, "url": URL_V1_CREATE_COMMENT, "text": "", "body": {}}
     payload = {"target": target_rrn, "body": text}
-    r = requests.post(URL_V1_CREATE_COMMENT, headers=V1_HEADERS, json=payload, timeout=60)
+    r = SESSION.post(URL_V1_CREATE_COMMENT, json=payload, timeout=60)
     return {
         "ok": r.status_code in (200, 201),
         "status": r.status_code,
@@ -290,22 +534,68 @@ def create_comment_v1(target_rrn: str, text: str) -> dict:
 def get_comments_v1(target_rrn: str) -> List[Dict]:
     """
     GET /idr/v1/comments?target=<RRN>
-    Returns list of comments for the investigation.
+    Returns list of comments for the investigation; raises on HTTP/network errors.
     """
     if not target_rrn:
         return []
+    params = {"target": target_rrn}
+    r = SESSION.get(URL_V1_COMMENTS, params=params, timeout=60)
+    r.raise_for_status()
+    data = _loads(r.content)
+    # API returns {"data": [...]} 
+    if isinstance(data, dict):
+        return data.get("data", [])
+    return data if isinstance(data, list) else []
+
+_END = object()  # end-of-input marker for _bounded_map (items may be None)
+
+def _bounded_map(fn: Callable, items: List, limit: int):
+    """
+    Yield fn(item) results in completion order, keeping at most `limit`
+    calls queued on EXECUTOR so one batch can't monopolize the shared pool.
+    """
+    pending = iter(items)
+    in_flight: Set[Future] = set()
+
+    def submit_next():
+        item = next(pending, _END)
+        if item is not _END:
+            in_flight.add(EXECUTOR.submit(fn, item))
+
+    for _ in range(max(limit, 1)):
+        submit_next()
+    while in_flight:
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for fut in done:
+            in_flight.discard(fut)
+            submit_next()
+            yield fut.result()
+
+def _apply_updates(rec: Dict, status: Optional[str], dispo: Optional[str],
+                   email: Optional[str], comment: Optional[str]) -> dict:
+    """
+    Run the full update sequence for one investigation record.
+    Returns dict with ok/title/commented/error; never raises.
+    """
+    inv_rrn = rec.get("rrn") or ""
+    inv_id = rec.get("id") or ""
+    inv_key_v2 = inv_id or inv_rrn
+    title = rec.get("title", "")
     try:
-        url = f"{BASE_V1}/comments"
-        params = {"target": target_rrn}
-        r = requests.get(url, headers=V1_HEADERS, params=params, timeout=60)
-        r.raise_for_status()
-        data = r.json()
-        # API returns {"data": [...]} 
-        if isinstance(data, dict):
-            return data.get("data", [])
-        return data if isinstance(data, list) else []
-    except Exception:
-        return []
+        if status:
+            set_status(inv_key_v2, status)
+        if dispo:
+            set_disposition(inv_key_v2, dispo)
+        if email:
+            assign_user(inv_key_v2, email)
+        if comment:
+            target_rrn = inv_rrn or get_rrn(inv_id)
+            info = create_comment_v1(target_rrn, comment)
+            if not info["ok"]:
+                raise RuntimeError(f"Comment HTTP {info['status']} {info['text']}")
+        return {"ok": True, "title": title, "commented": bool(comment), "error": ""}
+    except Exception as e:
+        return {"ok": False, "title": title, "commented": False, "error": str(e)}
 
 # ----------------------------
 # Progress Dialog
@@ -320,24 +610,35 @@ class ProgressDialog(ctk.CTkToplevel):
         self.label = ctk.CTkLabel(self, text="Please wait...", font=ctk.CTkFont(size=14))
         self.label.pack(pady=(20, 10))
         
-        self.progress = ctk.CTkProgressBar(self, width=400, mode="indeterminate")
+        self.progress = ctk.CTkProgressBar(self, width=400, mode="determinate")
+        self.progress.set(0)
         self.progress.pack(pady=10)
-        self.progress.start()
         
         self.detail_label = ctk.CTkLabel(self, text="", font=ctk.CTkFont(size=12))
         self.detail_label.pack(pady=10)
         
+        self._message = "Please wait..."
+        
         # Center on parent
         self.transient(parent)
         self.grab_set()
-        
+    
+    # All methods below must run on the Tk main thread; workers post them
+    # with parent.after(0, ...).
     def update_message(self, message: str):
+        self._message = message
         self.label.configure(text=message)
-        self.update()
         
     def update_detail(self, detail: str):
+        if not self.winfo_exists():
+            return
         self.detail_label.configure(text=detail)
-        self.update()
+    
+    def set_progress(self, done: int, total: int):
+        if not self.winfo_exists():
+            return
+        self.progress.set(done / total if total else 1.0)
+        self.label.configure(text=f"{self._message} ({done}/{total})")
 
 # ----------------------------
 # Assignee Configuration Dialog
@@ -370,6 +671,7 @@ class AssigneeConfigDialog(ctk.CTkToplevel):
         self.scroll_frame.pack(fill="both", expand=True, padx=15, pady=(0, 10))
         
         self.entry_rows = []
+        self.header_frame = None
         self.rebuild_list()
         
         # Buttons
@@ -406,12 +708,14 @@ class AssigneeConfigDialog(ctk.CTkToplevel):
             for widget in row:
                 widget.destroy()
         self.entry_rows.clear()
+        if self.header_frame is not None:
+            self.header_frame.destroy()
         
         # Header row
-        header_frame = ctk.CTkFrame(self.scroll_frame)
-        header_frame.pack(fill="x", padx=5, pady=(5, 10))
-        ctk.CTkLabel(header_frame, text="Full Name", width=200, anchor="w").pack(side="left", padx=5)
-        ctk.CTkLabel(header_frame, text="Email Address", width=280, anchor="w").pack(side="left", padx=5)
+        self.header_frame = ctk.CTkFrame(self.scroll_frame)
+        self.header_frame.pack(fill="x", padx=5, pady=(5, 10))
+        ctk.CTkLabel(self.header_frame, text="Full Name", width=200, anchor="w").pack(side="left", padx=5)
+        ctk.CTkLabel(self.header_frame, text="Email Address", width=280, anchor="w").pack(side="left", padx=5)
         
         # Add rows
         for idx, (name, email) in enumerate(self.assignees):
@@ -431,8 +735,11 @@ class AssigneeConfigDialog(ctk.CTkToplevel):
         
         if idx is not None:
             def remove_this():
-                self.assignees.pop(idx)
-                self.rebuild_list()
+                # Look up the row's current position; earlier removals shift indices
+                pos = next(i for i, row in enumerate(self.entry_rows) if row[0] is row_frame)
+                row_frame.destroy()
+                self.entry_rows.pop(pos)
+                self.assignees.pop(pos)
             remove_btn = ctk.CTkButton(
                 row_frame, 
                 text="✕", 
@@ -448,7 +755,7 @@ class AssigneeConfigDialog(ctk.CTkToplevel):
     
     def add_row(self):
         self.assignees.append(["", ""])
-        self.rebuild_list()
+        self.add_row_ui("", "", idx=len(self.assignees) - 1)
     
     def save(self):
         # Collect all entries
@@ -473,6 +780,13 @@ class AssigneeConfigDialog(ctk.CTkToplevel):
 # ----------------------------
 STATUSES = ["OPEN", "INVESTIGATING", "WAITING", "CLOSED"]
 DISPOSITIONS = ["", "BENIGN", "MALICIOUS", "NOT_APPLICABLE"]  # "" = don't send
+# Pack options shared by the comments/history boxes (re-applied after bulk redraws)
+TEXTBOX_PACK = {"fill": "both", "expand": True, "padx": 8, "pady": (0, 8)}
+_SEP60 = "=" * 60  # header rule for the comments/history boxes
+_DASH60 = "-" * 60  # rule between history entries
+
+# Widgets of one investigation card, kept so cards can be reconfigured and reused
+RowWidgets = namedtuple("RowWidgets", "frame chk title_lbl link_btn meta_lbl assignee_lbl")
 
 class App(ctk.CTk):
     def __init__(self):
@@ -488,9 +802,52 @@ class App(ctk.CTk):
         # assignee filter state
         self.assignee_filter_var = ctk.StringVar(value="All")
 
+        # after() id of a pending debounced rebuild_list, if any
+        self._rebuild_pending = None
+
+        # status lines queued by worker threads; drained in batches on the UI thread
+        self._log_queue: "queue.Queue[str]" = queue.Queue()
+        self._log_drain_armed = False
+
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.after(SETTINGS_SAFETY_FLUSH_MS, self._maybe_flush_settings)
+
+        # data holders (set up before any widget whose callbacks read them)
+        self.rows: List[Dict] = []
+        self.row_vars: List[ctk.BooleanVar] = []
+        self.row_frames: List[ctk.CTkFrame] = []
+        # row key (rrn or id) -> (rec, widgets); cards outlive sort/filter changes
+        self._row_pool: Dict[str, Tuple[Dict, RowWidgets]] = {}
+        # unpacked cards from vanished records, recycled by add_row
+        self._row_spares: List[RowWidgets] = []
+        # row key -> selection var, for every loaded row (rendered or not)
+        self._row_vars_by_key: Dict[str, ctk.BooleanVar] = {}
+        # after_idle id while another batch of cards is queued to render
+        self._render_pending = None
+        # rrn -> (fetched_at monotonic, comments); written from EXECUTOR threads
+        self._comments_cache: Dict[str, Tuple[float, List[Dict]]] = {}
+        # comments shown in the comments tab (newest first) and how many are written out
+        self._comments_sorted: List[Dict] = []
+        self._comments_shown = 0
+        self._comments_more_notice = ""
+        # in-flight comment prefetches for rows near the viewport
+        self._prefetch_futures: Dict[str, Future] = {}
+        self._prefetch_pending = None
+        # records in on-screen order; row_vars parallels it, row_frames covers the rendered prefix
+        self._current_view: List[Dict] = []
+        # ((sort, filter, id(rows)), sorted+filtered rows) for _sorted_rows_current_view
+        self._view_cache: Optional[Tuple[Tuple, List[Dict]]] = None
+        # placeholders until _startup has loaded settings
+        self.cfg: Dict = {}
+        self.region = ""
+        self.org_id = ""
+        self._assignees: List[Tuple[str, str]] = [("Unassigned / No Change", "")]
+        self._assignee_label_to_email: Dict[str, str] = {}
+
         # fonts
         self.font_title_bold = ctk.CTkFont(weight="bold", size=18)   # bigger title
         self.font_bold_red = ctk.CTkFont(weight="bold")
+        self.font_normal = ctk.CTkFont()
 
         # ----- Top bar -----
         top = ctk.CTkFrame(self)
@@ -520,7 +877,7 @@ class App(ctk.CTk):
         # Assignee Filter
         ctk.CTkLabel(top, text="Filter by Assignee:").pack(side="left", padx=(20,6))
         self.assignee_filter = ctk.CTkOptionMenu(
-            top, values=["All"], variable=self.assignee_filter_var, command=lambda *_: self.rebuild_list()
+            top, values=["All"], variable=self.assignee_filter_var, command=lambda *_: self._debounced_rebuild()
         )
         self.assignee_filter.pack(side="left", padx=(0, 8))
 
@@ -541,6 +898,9 @@ class App(ctk.CTk):
 
         self.scroll = ctk.CTkScrollableFrame(left, height=680)
         self.scroll.pack(fill="both", expand=True, padx=8, pady=(0, 8))
+        # CTkScrollableFrame has no public scroll hook; route its canvas's
+        # yscrollcommand through us to track the visible rows
+        self.scroll._parent_canvas.configure(yscrollcommand=self._on_list_yscroll)
 
         # Middle column: Action controls
         middle = ctk.CTkFrame(mid, width=380)
@@ -692,8 +1052,17 @@ class App(ctk.CTk):
         )
         refresh_comments_btn.pack(side="right")
         
+        # Packed by _display_comments only while more comments remain
+        self.load_more_comments_btn = ctk.CTkButton(
+            comments_header,
+            text="Load More",
+            command=self._load_more_comments,
+            width=100
+        )
+        self._comments_header_btn_pack = {"side": "right", "padx": (0, 8)}
+        
         self.comments_box = ctk.CTkTextbox(self.comments_content, height=600, wrap="word")
-        self.comments_box.pack(fill="both", expand=True, padx=8, pady=(0,8))
+        self.comments_box.pack(**TEXTBOX_PACK)
         
         # Comment History tab content
         history_header = ctk.CTkFrame(self.history_content)
@@ -714,21 +1083,23 @@ class App(ctk.CTk):
         clear_history_btn.pack(side="right")
         
         self.history_box = ctk.CTkTextbox(self.history_content, height=600, wrap="word")
-        self.history_box.pack(fill="both", expand=True, padx=8, pady=(0,8))
+        self.history_box.pack(**TEXTBOX_PACK)
         
-        # Initialize comment history
+        # Comment history is loaded in _startup
         self.comment_history = []
-        self._load_comment_history()
-        self._display_comment_history()
         
         # Show status tab by default
         self.current_tab = "status"
         self._switch_tab("status")
 
-        # data holders
-        self.rows: List[Dict] = []
-        self.row_vars: List[ctk.BooleanVar] = []
-        self.row_frames: List[ctk.CTkFrame] = []
+        # Settings I/O, first-run dialogs and the first refresh run once the
+        # window has painted
+        self.after(10, self._startup)
+
+    def _startup(self):
+        """Load settings/history, run first-run setup if needed, then refresh."""
+        self._load_comment_history()
+        self._display_comment_history()
 
         # ----- Resolve API key and assignees -----
         self.cfg = load_settings()
@@ -749,8 +1120,8 @@ class App(ctk.CTk):
         self.org_id = org_id
         
         # Check for assignees - if none, prompt for configuration
-        assignees = get_assignees_from_settings(self.cfg)
-        if len(assignees) <= 1:  # Only has "Unassigned"
+        self._assignees = get_assignees_from_settings(self.cfg)
+        if len(self._assignees) <= 1:  # Only has "Unassigned"
             self.first_run_assignee_setup()
             self.cfg = load_settings()
         
@@ -771,6 +1142,22 @@ class App(ctk.CTk):
             self._set_headers(api_key)
             self.refresh_async()
 
+    # ------- Lifecycle -------
+    def _maybe_flush_settings(self):
+        """Periodic safety flush so a crash loses at most one interval of edits."""
+        _flush_settings()
+        self.after(SETTINGS_SAFETY_FLUSH_MS, self._maybe_flush_settings)
+
+    def _on_close(self):
+        _flush_settings()
+        # Drop queued work; requests already running would still be joined at
+        # interpreter exit (up to timeout x retries), so leave via os._exit like
+        # the daemon threads this pool replaced. Settings are flushed above and
+        # history writes are synchronous, so nothing is lost.
+        EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+        os._exit(0)
+
     # ------- Tab switching -------
     def _switch_tab(self, tab_name: str):
         """Switch between Status, Comments, and History tabs."""
@@ -793,24 +1180,21 @@ class App(ctk.CTk):
         elif tab_name == "comments":
             self.comments_content.pack(fill="both", expand=True, padx=0, pady=(6,6))
             self.comments_tab_btn.configure(fg_color=["#3B8ED0", "#1F6AA5"])
+            # Usually served from the prefetch cache, so this is instant
+            self.refresh_selected_comments(force=False)
         else:  # history
             self.history_content.pack(fill="both", expand=True, padx=0, pady=(6,6))
             self.history_tab_btn.configure(fg_color=["#3B8ED0", "#1F6AA5"])
     
     # ------- Comment History Management -------
     def _load_comment_history(self):
-        """Load comment history from settings."""
-        cfg = load_settings()
-        self.comment_history = cfg.get("comment_history", [])
-        # Keep only last 50 comments
-        if len(self.comment_history) > 50:
-            self.comment_history = self.comment_history[-50:]
+        """Load comment history from the history file."""
+        self.comment_history = load_comment_history()
     
     def _save_comment_history(self):
-        """Save comment history to settings."""
-        cfg = load_settings()
-        cfg["comment_history"] = self.comment_history[-50:]  # Keep only last 50
-        save_settings(cfg)
+        """Rewrite the history file from memory."""
+        self.comment_history = self.comment_history[-HISTORY_KEEP:]
+        write_comment_history(self.comment_history)
     
     def _add_to_comment_history(self, comment_text: str):
         """Add a comment to history with timestamp."""
@@ -822,34 +1206,43 @@ class App(ctk.CTk):
             "timestamp": timestamp,
             "text": comment_text.strip()
         }
+        # LRU: a re-used text moves to the newest slot instead of taking a second one.
+        # The file just gets the new line; load_comment_history drops the stale copy.
+        self.comment_history = [e for e in self.comment_history if e.get("text") != entry["text"]]
         self.comment_history.append(entry)
-        self._save_comment_history()
+        self.comment_history = self.comment_history[-HISTORY_KEEP:]
+        append_comment_history(entry)
         self._display_comment_history()
         self._log_status("Comment added to history")
     
     def _display_comment_history(self):
         """Display comment history in the history tab."""
-        self.history_box.delete("1.0", "end")
-        
         if not self.comment_history:
-            self.history_box.insert("1.0", "No comment history yet.\n\nComments you send will appear here for easy reuse.")
+            self._replace_text(self.history_box, "No comment history yet.\n\nComments you send will appear here for easy reuse.")
             return
         
-        header = f"Comment History ({len(self.comment_history)} entries)\n"
-        header += "Click on any comment text to select and copy it.\n"
-        header += "=" * 60 + "\n\n"
-        self.history_box.insert("1.0", header)
+        header = (
+            f"Comment History ({len(self.comment_history)} entries)\n"
+            "Click on any comment text to select and copy it.\n"
+            f"{_SEP60}\n\n"
+        )
         
-        # Show newest first
+        # Show newest first; build the whole text so the widget sees one insert
+        parts: List[str] = []
         for idx, entry in enumerate(reversed(self.comment_history), 1):
             timestamp = entry.get("timestamp", "")
             text = entry.get("text", "")
-            
-            comment_entry = f"[{idx}] {timestamp}\n"
-            comment_entry += f"{text}\n"
-            comment_entry += "-" * 60 + "\n\n"
-            
-            self.history_box.insert("end", comment_entry)
+            parts.append(f"[{idx}] {timestamp}\n{text}\n{_DASH60}\n\n")
+        
+        self._replace_text(self.history_box, header + "".join(parts))
+    
+    def _replace_text(self, box: ctk.CTkTextbox, text: str):
+        """Swap a history/comments box's contents while unmapped so Tk lays it out once."""
+        box.pack_forget()
+        box.delete("1.0", "end")
+        box.insert("1.0", text)
+        # Both boxes are the last child packed in their tab, so order is preserved
+        box.pack(**TEXTBOX_PACK)
     
     def clear_comment_history(self):
         """Clear all comment history."""
@@ -863,8 +1256,92 @@ class App(ctk.CTk):
             self._display_comment_history()
             self._log_status("Comment history cleared")
     
-    def refresh_selected_comments(self):
+    # ------- Comments cache -------
+    def get_comments_cached(self, rrn: str) -> List[Dict]:
+        """Return comments for rrn, reusing a fetch younger than COMMENTS_CACHE_TTL."""
+        hit = self._comments_cache.get(rrn)
+        if hit and time.monotonic() - hit[0] < COMMENTS_CACHE_TTL:
+            return hit[1]
+        # Raising fetch: a failed request must not be cached as "no comments"
+        comments = add_local_times(get_comments_v1(rrn))
+        self._comments_cache[rrn] = (time.monotonic(), comments)
+        return comments
+    
+    def _schedule_prefetch_update(self, *_):
+        """Recompute the prefetch window once scrolling/layout settles."""
+        if self._prefetch_pending:
+            self.after_cancel(self._prefetch_pending)
+        self._prefetch_pending = self.after(150, self._update_prefetch_window)
+    
+    def _on_list_yscroll(self, first, last):
+        # Stands in for the scrollbar's own yscrollcommand; fires on wheel,
+        # scrollbar drag and resize alike
+        self.scroll._scrollbar.set(first, last)
+        # Near the bottom (or content shorter than the viewport): materialize more cards
+        if (float(last) > 0.9 and not self._render_pending
+                and len(self.row_frames) < len(self._current_view)):
+            self._render_pending = self.after_idle(self._render_more_rows)
+        self._schedule_prefetch_update()
+    
+    def _visible_row_range(self) -> Tuple[int, int]:
+        """Index range [start, end) of row_frames intersecting the viewport."""
+        n = len(self.row_frames)
+        if not n:
+            return 0, 0
+        height = self.scroll.winfo_height()
+        if height <= 1:  # not laid out yet; a later yscroll callback retries
+            return 0, 0
+        top, bottom = self.scroll._parent_canvas.yview()
+        y_top, y_bottom = top * height, bottom * height
+        
+        # Frames are packed top-to-bottom, so y is monotonic: binary search
+        lo, hi = 0, n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            f = self.row_frames[mid]
+            if f.winfo_y() + f.winfo_height() < y_top:
+                lo = mid + 1
+            else:
+                hi = mid
+        start = lo
+        hi = n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.row_frames[mid].winfo_y() <= y_bottom:
+                lo = mid + 1
+            else:
+                hi = mid
+        return start, max(lo, start + 1)
+    
+    def _update_prefetch_window(self):
+        """Prefetch comments for the visible rows ±PREFETCH_MARGIN; cancel the rest."""
+        self._prefetch_pending = None
+        start, end = self._visible_row_range()
+        window = self._current_view[max(start - PREFETCH_MARGIN, 0):end + PREFETCH_MARGIN]
+        wanted = {rec.get("rrn") for rec in window if rec.get("rrn")}
+        
+        for rrn, fut in list(self._prefetch_futures.items()):
+            if fut.done() or (rrn not in wanted and fut.cancel()):
+                del self._prefetch_futures[rrn]
+        
+        def store(fut, rrn):
+            if not fut.cancelled() and fut.exception() is None:
+                # Runs on the executor thread that completed the fetch
+                self._comments_cache[rrn] = (time.monotonic(), add_local_times(fut.result()))
+        
+        now = time.monotonic()
+        for rrn in wanted:
+            hit = self._comments_cache.get(rrn)
+            if rrn in self._prefetch_futures or (hit and now - hit[0] < COMMENTS_CACHE_TTL):
+                continue
+            fut = EXECUTOR.submit(get_comments_v1, rrn)
+            fut.add_done_callback(lambda f, r=rrn: store(f, r))
+            self._prefetch_futures[rrn] = fut
+    
+    def refresh_selected_comments(self, force: bool = True):
         """Fetch and display comments for the first selected investigation."""
+        self._comments_sorted = []
+        self.load_more_comments_btn.pack_forget()
         rows = self._selected_rows()
         if not rows:
             self.comments_box.delete("1.0", "end")
@@ -887,13 +1364,16 @@ class App(ctk.CTk):
             self.comments_box.insert("1.0", "Could not resolve RRN for this investigation.")
             return
         
+        if force:
+            self._comments_cache.pop(rrn, None)
+        
         # Fetch comments in background
         def worker():
             try:
-                comments = get_comments_v1(rrn)
-                self.after(0, lambda: self._display_comments(title, comments))
+                comments = self.get_comments_cached(rrn)
+                self.ui(self._display_comments, title, comments)
             except Exception as e:
-                self.after(0, lambda: self._display_comments_error(str(e)))
+                self.ui(self._display_comments_error, str(e))
         
         self.comments_box.delete("1.0", "end")
         self.comments_box.insert("1.0", f"Loading comments for:\n{title}\n\nPlease wait...")
@@ -903,40 +1383,59 @@ class App(ctk.CTk):
     
     def _display_comments(self, title: str, comments: List[Dict]):
         """Display fetched comments in the comments box."""
-        self.comments_box.delete("1.0", "end")
-        
-        header = f"Investigation: {title}\n"
-        header += f"Total Comments: {len(comments)}\n"
-        header += "=" * 60 + "\n\n"
-        self.comments_box.insert("1.0", header)
+        header = f"Investigation: {title}\nTotal Comments: {len(comments)}\n{_SEP60}\n\n"
         
         if not comments:
-            self.comments_box.insert("end", "No comments found for this investigation.")
+            self._replace_text(self.comments_box, header + "No comments found for this investigation.")
             return
         
         # Sort by timestamp (newest first)
-        sorted_comments = sorted(
+        self._comments_sorted = sorted(
             comments, 
             key=lambda c: c.get("created_time", ""),
             reverse=True
         )
+        self._comments_shown = 0
         
-        for idx, comment in enumerate(sorted_comments, 1):
+        # Only the first page goes into the Text widget; Load More appends the rest
+        self._replace_text(self.comments_box, header + self._next_comments_page())
+        self._log_status(f"Loaded {len(comments)} comment(s) for investigation")
+    
+    def _next_comments_page(self) -> str:
+        """Format the next COMMENTS_DISPLAY_PAGE comments, plus a notice if more remain."""
+        start = self._comments_shown
+        page = self._comments_sorted[start:start + COMMENTS_DISPLAY_PAGE]
+        self._comments_shown = start + len(page)
+        
+        parts: List[str] = []
+        for idx, comment in enumerate(page, start + 1):
             creator = comment.get("creator", {})
             creator_name = creator.get("name", "Unknown")
             creator_email = creator.get("email", "")
-            created = parse_iso_to_local(comment.get("created_time", ""))
+            created = comment["_created_local"]
             body = comment.get("body", "")
             
-            comment_text = f"[{idx}] {creator_name}"
-            if creator_email:
-                comment_text += f" <{creator_email}>"
-            comment_text += f"\n    Time: {created}\n"
-            comment_text += f"    {body}\n\n"
-            
-            self.comments_box.insert("end", comment_text)
-        
-        self._log_status(f"Loaded {len(comments)} comment(s) for investigation")
+            email_part = f" <{creator_email}>" if creator_email else ""
+            parts.append(f"[{idx}] {creator_name}{email_part}\n    Time: {created}\n    {body}\n\n")
+        
+        remaining = len(self._comments_sorted) - self._comments_shown
+        if remaining > 0:
+            self._comments_more_notice = f"... and {remaining} more (click Load More)\n"
+            parts.append(self._comments_more_notice)
+            self.load_more_comments_btn.pack(**self._comments_header_btn_pack)
+        else:
+            self._comments_more_notice = ""
+            self.load_more_comments_btn.pack_forget()
+        return "".join(parts)
+    
+    def _load_more_comments(self):
+        """Append the next page of the displayed investigation's comments."""
+        if self._comments_shown >= len(self._comments_sorted):
+            return
+        # Drop the trailing "... and N more" notice (+1 for Tk's implicit final newline)
+        if self._comments_more_notice:
+            self.comments_box.delete(f"end-{len(self._comments_more_notice) + 1}c", "end")
+        self.comments_box.insert("end", self._next_comments_page())
     
     def _display_comments_error(self, error: str):
         """Display error when fetching comments fails."""
@@ -971,6 +1470,10 @@ class App(ctk.CTk):
             self.region = region
             self.org_id = org_id
             self._refresh_settings_label()
+            if self.rows:
+                # Pooled cards hold console links built from the old region/org
+                self._sync_row_pool([])
+                self._debounced_rebuild()
             dialog.destroy()
             self._log_status(f"Region/Org updated: {region} / {org_id or '(none)'}")
         
@@ -1026,8 +1529,7 @@ class App(ctk.CTk):
     
     def configure_assignees(self):
         """Open assignee configuration dialog."""
-        current = get_assignees_from_settings(self.cfg)
-        dialog = AssigneeConfigDialog(self, current)
+        dialog = AssigneeConfigDialog(self, self._assignees)
         self.wait_window(dialog)
         
         if dialog.result:
@@ -1038,26 +1540,26 @@ class App(ctk.CTk):
     
     def _refresh_assignee_dropdown(self):
         """Refresh the assignee dropdown with current settings."""
-        assignees = get_assignees_from_settings(self.cfg)
-        labels = [f"{n} <{e}>" if e else n for n, e in assignees]
+        # Parsed once per settings change; reused by configure/update paths
+        self._assignees = get_assignees_from_settings(self.cfg)
+        self._assignee_label_to_email = {
+            (f"{n} <{e}>" if e else n): (e or "") for n, e in self._assignees
+        }
+        labels = list(self._assignee_label_to_email)
         self.assignee_choice.configure(values=labels)
         if labels:
             self.assignee_choice.set(labels[0])
 
     # ------- API key setup -------
     def _set_headers(self, api_key: str):
-        global V1_HEADERS, V2_HEADERS
-        V2_HEADERS = {
-            "X-Api-Key": api_key,
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "Accept-version": "investigations-preview",
-        }
+        global V1_HEADERS
         V1_HEADERS = {
             "X-Api-Key": api_key,
             "Accept": "application/json",
             "Content-Type": "application/json",
         }
+        # v1 headers are the common base; v2 calls add V2_EXTRA_HEADERS per request
+        SESSION.headers.update(V1_HEADERS)
 
     def _refresh_settings_label(self):
         cfg = load_settings()
@@ -1169,146 +1671,224 @@ class App(ctk.CTk):
 
     # ------- UI helpers -------
     def clear_list(self):
+        # Unpack only; pooled frames are reused by the next rebuild
         for f in self.row_frames:
-            f.destroy()
+            f.pack_forget()
         self.row_frames.clear()
         self.row_vars.clear()
+        self._current_view = []
+
+    def _row_key(self, rec: Dict) -> str:
+        return rec.get("rrn") or rec.get("id") or str(id(rec))
+
+    def _row_var(self, key: str) -> ctk.BooleanVar:
+        """The record's selection var, created on first sight and kept across rebuilds."""
+        var = self._row_vars_by_key.get(key)
+        if var is None:
+            var = self._row_vars_by_key[key] = ctk.BooleanVar(value=False)
+        return var
+
+    def _sync_row_pool(self, rows: List[Dict]):
+        """Re-point pooled cards at refreshed records; park cards whose record vanished."""
+        self.clear_list()
+        fresh = {self._row_key(r): r for r in rows}
+        for key in list(self._row_vars_by_key):
+            if key in fresh:
+                self._row_vars_by_key[key].set(False)
+            else:
+                del self._row_vars_by_key[key]
+        for key, (rec, widgets) in list(self._row_pool.items()):
+            new_rec = fresh.get(key)
+            if new_rec is None:
+                del self._row_pool[key]
+                self._row_spares.append(widgets)
+            elif new_rec != rec:
+                self._fill_row(widgets, new_rec, self._row_vars_by_key[key])
+                self._row_pool[key] = (new_rec, widgets)
 
     def _assignee_from_rec(self, rec: Dict) -> str:
-        return ((rec.get("assignee") or {}).get("email") or "").strip()
+        return rec.get("_assignee_email", "")
 
     def _apply_assignee_filter(self, rows: List[Dict]) -> List[Dict]:
         choice = self.assignee_filter_var.get()
         if choice == "All":
             return rows
         if choice == "Unassigned":
-            return [r for r in rows if not self._assignee_from_rec(r)]
-        return [r for r in rows if self._assignee_from_rec(r) == choice]
-
-    def add_row(self, rec: Dict):
-        rrn = rec.get("rrn", "")
-        title = rec.get("title", "") or "(no title)"
-        status = rec.get("status", "")
-        priority = rec.get("priority", "")
-        source = rec.get("source", "")
-        created_time = parse_iso_to_local(rec.get("created_time", ""))
-        assignee_email = self._assignee_from_rec(rec)
-        link = console_link(rrn, self.region, self.org_id)
+            return [r for r in rows if not r["_assignee_email"]]
+        return [r for r in rows if r["_assignee_email"] == choice]
 
+    def _build_row_widgets(self) -> RowWidgets:
+        """Create an empty investigation card; _fill_row gives it content."""
         # Card frame with border & padding for clear separation
         row = ctk.CTkFrame(self.scroll, border_width=1, corner_radius=10)
-        row.pack(fill="x", padx=6, pady=6)
 
-        var = ctk.BooleanVar(value=False)
-        chk = ctk.CTkCheckBox(row, text="", variable=var, width=22)
+        chk = ctk.CTkCheckBox(row, text="", width=22)
         chk.grid(row=0, column=0, rowspan=3, padx=(8, 12), pady=8, sticky="nw")
 
         # line 1: title (bigger bold) + open button
-        title_lbl = ctk.CTkLabel(row, text=title, anchor="w", font=self.font_title_bold)
+        title_lbl = ctk.CTkLabel(row, text="", anchor="w", font=self.font_title_bold)
         title_lbl.grid(row=0, column=1, sticky="w", padx=4, pady=(10, 2))
 
+        link_btn = ctk.CTkButton(row, text="Open", width=90)
+        link_btn.grid(row=0, column=2, padx=(10, 10), pady=(10,2), sticky="ne")
+
+        # line 2: meta (Created Time + Status/Priority/Source)
+        meta_lbl = ctk.CTkLabel(row, text="", anchor="w")
+        meta_lbl.grid(row=1, column=1, sticky="w", padx=4, pady=(0,2), columnspan=2)
+
+        # line 3: assignee
+        assignee_lbl = ctk.CTkLabel(row, text="", anchor="w")
+        assignee_lbl.grid(row=2, column=1, sticky="w", padx=4, pady=(0,10), columnspan=2)
+
+        row.grid_columnconfigure(1, weight=1)
+        return RowWidgets(row, chk, title_lbl, link_btn, meta_lbl, assignee_lbl)
+
+    def _fill_row(self, w: RowWidgets, rec: Dict, var: ctk.BooleanVar):
+        """(Re)configure a card for rec; used for new and recycled cards alike."""
+        rrn = rec.get("rrn", "")
+        title = rec.get("title", "") or "(no title)"
+        status = rec.get("status", "")
+        priority = rec.get("priority", "")
+        source = rec.get("source", "")
+        created_time = rec.get("_created_local", "")
+        assignee_email = self._assignee_from_rec(rec)
+        link = _cached_console_link(rrn, self.region, self.org_id)
+
+        w.chk.configure(variable=var)
+        w.title_lbl.configure(text=title)
+
         if link:
             def open_link(url=link):
                 webbrowser.open(url, new=2)
                 self._log_status("Opened investigation in browser.")
-            link_btn = ctk.CTkButton(row, text="Open", width=90, command=open_link)
-            link_btn.grid(row=0, column=2, padx=(10, 10), pady=(10,2), sticky="ne")
+            w.link_btn.configure(command=open_link)
+            w.link_btn.grid()
+        else:
+            w.link_btn.grid_remove()
 
-        # line 2: meta (Created Time + Status/Priority/Source)
         meta = f"Created: {created_time}    Status: {status}    Priority: {priority}    Source: {source}"
-        meta_lbl = ctk.CTkLabel(row, text=meta, anchor="w")
-        meta_lbl.grid(row=1, column=1, sticky="w", padx=4, pady=(0,2), columnspan=2)
+        w.meta_lbl.configure(text=meta)
 
-        # line 3: assignee (red bold 'EMPTY' if none)
+        # red bold 'EMPTY' if none
         if assignee_email:
-            assignee_lbl = ctk.CTkLabel(row, text=f"Assignee: {assignee_email}", anchor="w")
-        else:
-            assignee_lbl = ctk.CTkLabel(
-                row,
-                text="Assignee: EMPTY",
-                anchor="w",
-                font=self.font_bold_red,
-                text_color="red"
+            w.assignee_lbl.configure(
+                text=f"Assignee: {assignee_email}",
+                font=self.font_normal,
+                text_color=ctk.ThemeManager.theme["CTkLabel"]["text_color"],
             )
-        assignee_lbl.grid(row=2, column=1, sticky="w", padx=4, pady=(0,10), columnspan=2)
-
-        row.grid_columnconfigure(1, weight=1)
+        else:
+            w.assignee_lbl.configure(text="Assignee: EMPTY", font=self.font_bold_red, text_color="red")
 
-        self.row_vars.append(var)
-        self.row_frames.append(row)
+    def add_row(self, rec: Dict, var: ctk.BooleanVar) -> ctk.CTkFrame:
+        """Fill a spare (or new) card for rec, add it to the row pool, and return its frame unpacked."""
+        widgets = self._row_spares.pop() if self._row_spares else self._build_row_widgets()
+        self._fill_row(widgets, rec, var)
+        self._row_pool[self._row_key(rec)] = (rec, widgets)
+        return widgets.frame
 
     def rebuild_list(self):
         self.clear_list()
 
-        def key_fn(r):
-            dt = r.get("created_time") or ""
-            try:
-                if dt.endswith("Z"):
-                    d = datetime.fromisoformat(dt.replace("Z", "+00:00"))
-                else:
-                    d = datetime.fromisoformat(dt)
-            except Exception:
-                d = datetime(1970, 1, 1, tzinfo=timezone.utc)
-            return d
-
-        rows_sorted = sorted(self.rows, key=key_fn, reverse=not self.sort_oldest_first)
-        rows_sorted = self._apply_assignee_filter(rows_sorted)
+        rows_sorted = self._sorted_rows_current_view()
 
-        for rec in rows_sorted:
-            self.add_row(rec)
+        # Selection state exists for every row; cards are materialized lazily
+        self.row_vars = [self._row_var(self._row_key(rec)) for rec in rows_sorted]
+        self._current_view = rows_sorted
+        self._render_more_rows()
+        self._schedule_prefetch_update()
 
         direction = "Oldest → Newest" if self.sort_oldest_first else "Newest → Oldest"
         self._log_status(f"Loaded {len(rows_sorted)} (filtered) · {direction}")
 
+    def _render_more_rows(self):
+        """Pack the next ROW_RENDER_BATCH cards of the current view, building any not pooled yet."""
+        self._render_pending = None
+        start = len(self.row_frames)
+        for i in range(start, min(start + ROW_RENDER_BATCH, len(self._current_view))):
+            rec = self._current_view[i]
+            pooled = self._row_pool.get(self._row_key(rec))
+            frame = pooled[1].frame if pooled else self.add_row(rec, self.row_vars[i])
+            frame.pack(fill="x", padx=6, pady=6)
+            self.row_frames.append(frame)
+
+    # ------- thread handoff -------
+    def ui(self, fn, *args):
+        """Run fn(*args) on the Tk main loop. Worker threads must never touch widgets directly."""
+        self.after(0, fn, *args)
+
     # ------- logging helper -------
     def _log_status(self, msg: str):
+        self._drain_log_queue()  # keep queued worker lines ahead of this one
         line = f"[{now_str()}] {msg}\n"
         self.status_box.insert("end", line)
         self.status_box.see("end")
 
+    def _queue_log_status(self, msg: str):
+        """Thread-safe _log_status; lines are written in one batch every LOG_DRAIN_MS."""
+        self._log_queue.put(f"[{now_str()}] {msg}\n")
+        if not self._log_drain_armed:
+            self._log_drain_armed = True
+            self.after(LOG_DRAIN_MS, self._drain_log_queue)
+
+    def _drain_log_queue(self):
+        # Disarm before draining so a line queued meanwhile re-arms the drain
+        self._log_drain_armed = False
+        lines: List[str] = []
+        try:
+            while True:
+                lines.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        if lines:
+            self.status_box.insert("end", "".join(lines))
+            self.status_box.see("end")
+
     # ------- async actions -------
     def refresh_async(self):
         """Refresh in background thread with progress dialog."""
         def worker():
             try:
-                data = list_investigations()
-                self.after(0, lambda: self._refresh_complete(data))
+                data = add_local_times(list_investigations(
+                    on_progress=lambda done, total: self.ui(progress.set_progress, done, total)
+                ))
+                self.ui(self._refresh_complete, data)
             except Exception as e:
-                self.after(0, lambda: self._refresh_error(e))
+                self.ui(self._refresh_error, e)
+            finally:
+                # Posted after the result callback, so the dialog closes once
+                # _refresh_complete/_refresh_error has been queued.
+                self.ui(progress.destroy)
         
         progress = ProgressDialog(self, "Refreshing Investigations")
         progress.update_message("Fetching investigations from API...")
         
         def start_work():
-            thread = threading.Thread(target=worker, daemon=True)
-            thread.start()
-            self._check_thread_progress(progress, thread)
+            threading.Thread(target=worker, daemon=True).start()
         
         self.after(100, start_work)
     
-    def _check_thread_progress(self, progress_dialog, thread):
-        """Check if thread is still alive, close dialog when done."""
-        if thread.is_alive():
-            self.after(100, lambda: self._check_thread_progress(progress_dialog, thread))
-        else:
-            progress_dialog.destroy()
-    
     def _refresh_complete(self, data: List[Dict]):
         """Called when refresh completes successfully."""
         self.rows = data
+        # Derive once per refresh; sorting/filtering then only do dict lookups.
+        # Must run before _sync_row_pool, which compares records against pooled copies.
+        for r in self.rows:
+            r["_sort_key"] = _parse_created(r.get("created_time") or "")
+            r["_assignee_email"] = ((r.get("assignee") or {}).get("email") or "").strip()
+        self._view_cache = None
+        _fetch_rrn.cache_clear()  # the fresh listing repopulated _ID_TO_RRN
+        self._sync_row_pool(data)
+        self._comments_cache.clear()
         
         # Populate assignee filter options (All, Unassigned, unique emails)
-        emails: Set[str] = set()
-        for r in self.rows:
-            e = self._assignee_from_rec(r)
-            if e:
-                emails.add(e)
+        emails: Set[str] = {r["_assignee_email"] for r in self.rows}
+        emails.discard("")
         options = ["All", "Unassigned"] + sorted(emails, key=lambda x: x.lower())
         self.assignee_filter.configure(values=options)
         if self.assignee_filter_var.get() not in options:
             self.assignee_filter_var.set("All")
         
-        self.rebuild_list()
+        self._debounced_rebuild()
         self.select_all_var.set(False)
         self._log_status(f"Refresh complete - {len(data)} total investigations loaded")
     
@@ -1318,6 +1898,7 @@ class App(ctk.CTk):
         messagebox.showerror("Error", str(error))
 
     def toggle_select_all(self):
+        self._flush_pending_rebuild()
         new_val = self.select_all_var.get()
         for v in self.row_vars:
             v.set(new_val)
@@ -1329,29 +1910,39 @@ class App(ctk.CTk):
             text="Sort by Created Time (Oldest → Newest)" if self.sort_oldest_first
                  else "Sort by Created Time (Newest → Oldest)"
         )
+        self._debounced_rebuild()
+
+    def _debounced_rebuild(self):
+        """Coalesce bursts of sort/filter/refresh changes into a single rebuild_list."""
+        if self._rebuild_pending:
+            self.after_cancel(self._rebuild_pending)
+        self._rebuild_pending = self.after(REBUILD_DEBOUNCE_MS, self._run_pending_rebuild)
+
+    def _run_pending_rebuild(self):
+        self._rebuild_pending = None
         self.rebuild_list()
 
+    def _flush_pending_rebuild(self):
+        """Run a pending rebuild now so row_vars match the current sort/filter."""
+        if self._rebuild_pending:
+            self.after_cancel(self._rebuild_pending)
+            self._run_pending_rebuild()
+
     def _sorted_rows_current_view(self) -> List[Dict]:
-        def key_fn(r):
-            dt = r.get("created_time") or ""
-            try:
-                if dt.endswith("Z"):
-                    d = datetime.fromisoformat(dt.replace("Z", "+00:00"))
-                else:
-                    d = datetime.fromisoformat(dt)
-            except Exception:
-                d = datetime(1970, 1, 1, tzinfo=timezone.utc)
-            return d
-        rows_sorted = sorted(self.rows, key=key_fn, reverse=not self.sort_oldest_first)
-        return self._apply_assignee_filter(rows_sorted)
+        key = (self.sort_oldest_first, self.assignee_filter_var.get(), id(self.rows))
+        if self._view_cache and self._view_cache[0] == key:
+            return self._view_cache[1]
+        # _sort_key is precomputed per record in _refresh_complete
+        rows_sorted = sorted(self.rows, key=itemgetter("_sort_key"), reverse=not self.sort_oldest_first)
+        rows_sorted = self._apply_assignee_filter(rows_sorted)
+        self._view_cache = (key, rows_sorted)
+        return rows_sorted
 
     def _selected_rows(self) -> List[Dict]:
-        rows_sorted = self._sorted_rows_current_view()
-        selected_rows: List[Dict] = []
-        for i, v in enumerate(self.row_vars):
-            if v.get() and i < len(rows_sorted):
-                selected_rows.append(rows_sorted[i])
-        return selected_rows
+        self._flush_pending_rebuild()
+        # row_vars is index-aligned with the view rebuild_list rendered
+        rows_sorted = self._current_view
+        return [rows_sorted[i] for i, v in enumerate(self.row_vars) if v.get() and i < len(rows_sorted)]
 
     def update_selected_async(self):
         """Update selected investigations in background thread."""
@@ -1365,55 +1956,39 @@ class App(ctk.CTk):
         chosen_assignee_label = self.assignee_choice.get()
         comment = self.comment_box.get("1.0", "end").strip() or None
 
-        # map label -> email
-        assignees = get_assignees_from_settings(self.cfg)
-        chosen_email = None
-        for (n, e) in assignees:
-            label = f"{n} <{e}>" if e else n
-            if label == chosen_assignee_label:
-                chosen_email = e or None
-                break
+        chosen_email = self._assignee_label_to_email.get(chosen_assignee_label) or None
 
         total = len(rows)
         results = {"successes": 0, "fails": []}
         
         progress = ProgressDialog(self, "Updating Investigations")
+        progress.update_message(f"Updating {total} investigation(s)...")
         
         def worker():
-            for idx, rec in enumerate(rows, start=1):
-                inv_rrn = rec.get("rrn") or ""
-                inv_id = rec.get("id") or ""
-                inv_key_v2 = inv_id or inv_rrn
-                title = rec.get("title", "")
+            # Only this thread reads/writes `results`, so no locking is needed
+            updates = _bounded_map(
+                lambda rec: _apply_updates(rec, chosen_status, chosen_dispo, chosen_email, comment),
+                rows,
+                min(UPDATE_CONCURRENCY, total),
+            )
+            for idx, res in enumerate(updates, start=1):
+                title = res["title"]
                 
                 # Update progress
-                self.after(0, lambda i=idx, t=title: progress.update_detail(f"Processing {i}/{total}: {t[:50]}..."))
+                self.ui(progress.set_progress, idx, total)
+                self.ui(progress.update_detail, f"Last: {title[:50]}")
                 
-                try:
-                    if chosen_status:
-                        set_status(inv_key_v2, chosen_status)
-                    if chosen_dispo:
-                        set_disposition(inv_key_v2, chosen_dispo)
-                    if chosen_email:
-                        assign_user(inv_key_v2, chosen_email)
-                    if comment:
-                        target_rrn = inv_rrn or get_rrn(inv_id)
-                        info = create_comment_v1(target_rrn, comment)
-                        if not info["ok"]:
-                            raise RuntimeError(f"Comment HTTP {info['status']} {info['text']}")
-                        # Add to history on first successful comment (only once per bulk update)
-                        if idx == 1 and results["successes"] == 0:
-                            self.after(0, lambda c=comment: self._add_to_comment_history(c))
-                    
+                if res["ok"]:
+                    # Add to history on first successful comment (only once per bulk update)
+                    if res["commented"] and results["successes"] == 0:
+                        self.ui(self._add_to_comment_history, comment)
                     results["successes"] += 1
-                    self.after(0, lambda i=idx, t=total, ti=title: 
-                              self._log_status(f"✓ Updated {i}/{t}: {ti}"))
-                except Exception as e:
-                    results["fails"].append(f"{title}: {e}")
-                    self.after(0, lambda i=idx, t=total, ti=title, er=str(e): 
-                              self._log_status(f"✗ Failed {i}/{t}: {ti} — {er}"))
+                    self._queue_log_status(f"✓ Updated {idx}/{total}: {title}")
+                else:
+                    results["fails"].append(f"{title}: {res['error']}")
+                    self._queue_log_status(f"✗ Failed {idx}/{total}: {title} — {res['error']}")
             
-            self.after(0, lambda: self._update_complete(results, total, progress))
+            self.ui(self._update_complete, results, total, progress)
         
         def start_work():
             thread = threading.Thread(target=worker, daemon=True)